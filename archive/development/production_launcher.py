@@ -11,11 +11,23 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add project directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+from playwright.async_api import async_playwright
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-from test_automation import test_name_search
 from config import Config
+from production_cli import ProductionCLI, BROWSER_ARGS
+from readysearch_automation.input_loader import SearchRecord
+
+async def run_search(name: str, config: dict) -> dict:
+    """Run one search through ProductionCLI's search path."""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=config['headless'], args=BROWSER_ARGS)
+        try:
+            return await ProductionCLI().search_person(SearchRecord(name=name), browser)
+        finally:
+            await browser.close()
 
 def main():
     """Main launcher interface."""
@@ -35,7 +47,7 @@ def main():
     
     # Run the search
     print("⚡ Starting automation...")
-    result = asyncio.run(test_name_search(name, config))
+    result = asyncio.run(run_search(name, config))
     
     # Display results
     print("\n" + "=" * 50)
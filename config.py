@@ -1,5 +1,6 @@
 """Configuration settings for ReadySearch automation."""
 
+import os
 from typing import Dict, Any
 
 
@@ -17,6 +18,7 @@ class Config:
     DELAY_BETWEEN_SEARCHES = 2.5
     PAGE_TIMEOUT = 30000  # milliseconds
     ELEMENT_TIMEOUT = 10000  # milliseconds
+    RESULTS_TIMEOUT = 15000  # milliseconds
     
     # Retry configuration
     MAX_RETRIES = 3
@@ -31,6 +33,15 @@ class Config:
         '--disable-gpu'
     ]
     
+    # Resource types that are never needed to read result rows
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+    
+    # The results page is ready once a result row or a no-records message is in the DOM
+    RESULTS_READY_SELECTOR = (
+        'tr:has-text("Date of Birth:"), :text("No records found"), :text("No results"), '
+        ':text("No matches"), .no-results, .empty-results'
+    )
+    
     # User agent for realistic requests
     USER_AGENT = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -95,4 +106,20 @@ class Config:
             'input_file': cls.INPUT_FILE,
             'output_file': cls.OUTPUT_FILE,
             'log_file': cls.LOG_FILE
-        }
\ No newline at end of file
+        }
+
+
+def env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer override from the environment, warning about unusable values"""
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        print(f"⚠️ Ignoring {name}={raw_value!r}: not an integer, using {default}")
+        return default
+    if value < 1:
+        print(f"⚠️ {name}={value} is below 1, using 1")
+        return 1
+    return value
@@ -172,6 +172,10 @@ class EnhancedReadySearchCLI:
             self.console.print("[red]❌ No valid names found in input[/red]")
             return []
         
+        return await self.perform_search_records(search_records)
+    
+    async def perform_search_records(self, search_records: List[SearchRecord]) -> List[SearchResult]:
+        """Search already-parsed records, skipping input parsing"""
         results = []
         
         # Progress bar setup
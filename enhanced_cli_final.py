@@ -539,7 +539,7 @@ class EnhancedReadySearchCLI:
                 print(f"🚀 Large batch detected ({len(search_records)} records). Using intelligent chunking...")
             return await self.chunk_processor.process_chunked_batch(search_records, SearchResult)
         else:
-            return await self.perform_search_original(names_input)
+            return await self.perform_search_records(search_records)
     
     async def perform_search_original(self, names_input: str) -> List[SearchResult]:
         """Original search method for small batches"""
@@ -548,6 +548,10 @@ class EnhancedReadySearchCLI:
         if not search_records:
             return []
         
+        return await self.perform_search_records(search_records)
+    
+    async def perform_search_records(self, search_records: List) -> List[SearchResult]:
+        """Search already-parsed records without chunking, skipping input parsing"""
         results = []
         
         # Progress tracking
@@ -349,10 +349,12 @@ class EnhancedReadySearchCLI:
         self.console.print(menu_panel)
         self.console.print("\n")
     
-    async def perform_chunked_batch_search(self, names_input: str) -> List[SearchResult]:
-        """Perform intelligent chunked batch search"""
+    async def perform_chunked_batch_search(self, names_input: str,
+                                           search_records: Optional[List[SearchRecord]] = None) -> List[SearchResult]:
+        """Perform intelligent chunked batch search (pass search_records to skip re-parsing)"""
         # Parse input into search records
-        search_records = self.parse_names_input(names_input)
+        if search_records is None:
+            search_records = self.parse_names_input(names_input)
         
         if not search_records:
             self.console.print("[red]❌ No valid names found in input[/red]")
@@ -519,10 +521,10 @@ class EnhancedReadySearchCLI:
         # Automatic chunking decision
         if len(search_records) > 10:
             self.console.print(f"🚀 Large batch detected ({len(search_records)} records). Using intelligent chunking...")
-            return await self.perform_chunked_batch_search(names_input)
+            return await self.perform_chunked_batch_search(names_input, search_records)
         else:
             # Use original method for small batches
-            return await self.perform_search_original(names_input)
+            return await self.perform_search_records(search_records)
     
     async def perform_search_original(self, names_input: str) -> List[SearchResult]:
         """Original search method for backward compatibility"""
@@ -532,6 +534,10 @@ class EnhancedReadySearchCLI:
             self.console.print("[red]❌ No valid names found in input[/red]")
             return []
         
+        return await self.perform_search_records(search_records)
+    
+    async def perform_search_records(self, search_records: List[SearchRecord]) -> List[SearchResult]:
+        """Search already-parsed records without chunking, skipping input parsing"""
         results = []
         
         # Progress bar setup
@@ -53,13 +53,8 @@ class ReadySearchAutomation:
         try:
             self.logger.info(f"Starting enhanced automation for {len(names)} names")
             
-            # Start browser
-            await self.browser_controller.start_browser()
-            
-            # Navigate to search page
-            navigation_success = await self.browser_controller.navigate_to_search_page()
-            if not navigation_success:
-                self.logger.error("Failed to navigate to search page")
+            # Start browser and navigate to search page
+            if not await self.start():
                 return False
                 
             # Process each name with enhanced validation
@@ -68,20 +63,7 @@ class ReadySearchAutomation:
                 name_str = name.name if hasattr(name, 'name') else str(name)
                 self.logger.info(f"Processing {i}/{len(names)}: {name_str}")
                 
-                try:
-                    # Search for the name with enhanced validation
-                    search_result = await self._search_single_name_enhanced(name)
-                    
-                    # Process results with detailed statistics
-                    self._process_search_result(name, search_result)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing {name_str}: {str(e)}")
-                    self.reporter.add_result(
-                        name=name_str,
-                        status='Error',
-                        error=str(e)
-                    )
+                await self.search_one(name)
                     
                 # Rate limiting delay
                 if i < len(names):
@@ -101,7 +83,69 @@ class ReadySearchAutomation:
             
         finally:
             # Clean up browser
-            await self.browser_controller.cleanup()
+            await self.close()
+    
+    async def start(self) -> bool:
+        """
+        Start the browser and open the search page.
+        
+        Callers that search many names one at a time (e.g. the API server)
+        start once, call search_one per name and close when done, so the
+        browser launch is paid once rather than per name.
+        
+        Returns:
+            True if the search page is ready
+        """
+        await self.browser_controller.start_browser()
+        
+        navigation_success = await self.browser_controller.navigate_to_search_page()
+        if not navigation_success:
+            self.logger.error("Failed to navigate to search page")
+            return False
+        
+        return True
+    
+    async def search_one(self, name) -> Dict[str, Any]:
+        """
+        Search a single name on the already started browser.
+        
+        Args:
+            name: Name to search for
+            
+        Returns:
+            The result recorded by the reporter for this search
+        """
+        name_str = name.name if hasattr(name, 'name') else str(name)
+        result_count = self.reporter.get_result_count()
+        
+        try:
+            # Search for the name with enhanced validation
+            search_result = await self._search_single_name_enhanced(name)
+            
+            # Process results with detailed statistics
+            self._process_search_result(name, search_result)
+                
+        except Exception as e:
+            self.logger.error(f"Error processing {name_str}: {str(e)}")
+            self.reporter.add_result(
+                name=name_str,
+                status='Error',
+                error=str(e)
+            )
+        
+        # _process_search_result logs and swallows its own failures
+        if self.reporter.get_result_count() == result_count:
+            self.reporter.add_result(
+                name=name_str,
+                status='Error',
+                error='Search result could not be processed'
+            )
+            
+        return self.reporter.results[-1]
+    
+    async def close(self):
+        """Close the browser started by start()."""
+        await self.browser_controller.cleanup()
     
     def _process_search_result(self, name: str, search_result: Dict[str, Any]):
         """Process search result with enhanced statistics."""
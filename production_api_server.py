@@ -5,26 +5,38 @@ NO MOCK DATA - Uses actual ReadySearch automation with advanced matching.
 """
 
 import asyncio
+import concurrent.futures
+import json
 import logging
 import threading
 import uuid
 import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from typing import Dict, List, Any
+from asyncio_throttle import Throttler
+from typing import Dict, List, Any, Optional
 import sys
 import os
 
+# Fast JSON encoding for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add current directory to path
 sys.path.append(os.path.dirname(__file__))
 
 # Import REAL automation system - NO MOCKS
 from main import ReadySearchAutomation
-from config import Config
+from config import Config, env_positive_int
 from readysearch_automation.input_loader import SearchRecord
 from readysearch_automation.enhanced_result_parser import PersonResult
-from readysearch_automation.advanced_name_matcher import AdvancedNameMatcher, MatchType
+from readysearch_automation.advanced_name_matcher import MatchType, match_names_cached
+from readysearch_automation.text_parsing import parse_name_entries
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,12 +45,84 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
-# In-memory storage for sessions and results
-active_sessions = {}
-session_results = {}
+def _dumps(obj: Any) -> str:
+    """Encode a JSON value as text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def json_response(obj: Any) -> Response:
+    """Build a JSON response, encoding with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(obj), mimetype='application/json')
+    return jsonify(obj)
+
+@dataclass(slots=True)
+class Session:
+    """State of one automation session, shared by request threads and its worker."""
+    session_id: str
+    search_records: List[Dict[str, Any]]
+    config: Dict[str, Any]
+    status: str = 'started'
+    created_at: str = ''
+    total_names: int = 0
+    processed_names: int = 0
+    current_name: str = ''
+    current_index: int = 0
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    completed_at: Optional[str] = None
+    stopped_at: Optional[str] = None
+    error: Optional[str] = None
+    # Handle of the worker on the automation loop, used to cancel it on stop
+    future: Optional[concurrent.futures.Future] = field(default=None, repr=False, compare=False)
+    # Condition rather than a bare lock so event streams can wait for new results
+    lock: threading.Condition = field(default_factory=threading.Condition, repr=False, compare=False)
+    
+    @property
+    def finished(self) -> bool:
+        """True once the session will not produce further results."""
+        return self.status in ('completed', 'error', 'stopped')
+    
+    def to_dict(self, since: int = 0) -> Dict[str, Any]:
+        """Snapshot the session for a JSON response (internal handles are left out).
+        
+        Args:
+            since: Number of leading results the caller already has
+        """
+        with self.lock:
+            data = {f.name: getattr(self, f.name) for f in fields(self) if f.repr}
+            data['results'] = self.results[since:]
+        return data
+    
+    def summary(self) -> Dict[str, Any]:
+        """Progress fields only, for listings that should not carry every result."""
+        with self.lock:
+            return {
+                'session_id': self.session_id,
+                'status': self.status,
+                'total_names': self.total_names,
+                'processed_names': self.processed_names,
+                'created_at': self.created_at,
+                'completed_at': self.completed_at,
+                'stopped_at': self.stopped_at,
+                'error': self.error
+            }
+
+# In-memory storage for sessions, keyed by session id
+active_sessions: Dict[str, Session] = {}
+
+# One event loop on one background thread runs every session's automation
+automation_loop = asyncio.new_event_loop()
+threading.Thread(target=automation_loop.run_forever, name='automation-loop', daemon=True).start()
+
+# Browsers opened per session unless the client sets config['concurrency']
+DEFAULT_SESSION_CONCURRENCY = 3
+
+# Request threads for the production WSGI server; event streams hold one each
+WSGI_THREADS = env_positive_int('READYSEARCH_API_THREADS', 16)
 
-# Initialize the advanced matcher
-advanced_matcher = AdvancedNameMatcher()
+# Idle interval after which an event stream sends a keep-alive comment
+SSE_KEEPALIVE_SECONDS = 15
 
 class ProductionAutomationEngine:
     """
@@ -47,8 +131,6 @@ class ProductionAutomationEngine:
     """
     
     def __init__(self):
-        self.advanced_matcher = AdvancedNameMatcher()
-        
         # Base REAL automation configuration - use Config.get_config() to ensure all required keys
         self.base_config = Config.get_config()
         
@@ -62,13 +144,41 @@ class ProductionAutomationEngine:
         
         logger.info("🚀 Production Automation Engine initialized with REAL automation")
     
-    async def run_search(self, search_record: SearchRecord, session_config: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def open_automation(self, session_config: Dict[str, Any] = None) -> ReadySearchAutomation:
+        """
+        Start a REAL automation browser that serves every search of a session.
+        
+        Args:
+            session_config: Optional session-specific configuration overrides
+            
+        Returns:
+            A started ReadySearchAutomation; the caller must close() it
+        """
+        # Merge session config with base config
+        config = self.base_config.copy()
+        if session_config:
+            logger.info(f"📋 Applying session config: {session_config}")
+            config.update(session_config)
+            logger.info(f"🔧 Browser mode: {'VISIBLE' if not config.get('headless', True) else 'HEADLESS'}")
+        
+        # Create REAL automation instance with session-specific config
+        automation = ReadySearchAutomation(config)
+        try:
+            if not await automation.start():
+                raise RuntimeError("Failed to open the ReadySearch search page")
+        except Exception:
+            await automation.close()
+            raise
+        
+        return automation
+    
+    async def run_search(self, search_record: SearchRecord, automation: ReadySearchAutomation) -> Dict[str, Any]:
         """
         Run a REAL search operation using the production ReadySearch automation.
         
         Args:
             search_record: The search record to process
-            session_config: Optional session-specific configuration overrides
+            automation: Started automation from open_automation()
             
         Returns:
             Dict containing search results with advanced matching details
@@ -76,104 +186,75 @@ class ProductionAutomationEngine:
         try:
             logger.info(f"🔍 Starting REAL automation for: {search_record.name}")
             
-            # Merge session config with base config
-            config = self.base_config.copy()
-            if session_config:
-                logger.info(f"📋 Applying session config: {session_config}")
-                config.update(session_config)
-                logger.info(f"🔧 Browser mode: {'VISIBLE' if not config.get('headless', True) else 'HEADLESS'}")
-            
-            # Create REAL automation instance with session-specific config
-            automation = ReadySearchAutomation(config)
-            
-            # Run REAL automation for this single record
+            # Run REAL automation for this single record on the session's browser
             start_time = time.time()
-            success = await automation.run_automation([search_record])
+            result = await automation.search_one(search_record.name)
             end_time = time.time()
             
             search_duration = int((end_time - start_time) * 1000)  # Convert to milliseconds
             
-            logger.info(f"🔧 Automation completed for {search_record.name}, success: {success}")
-            logger.info(f"📊 Reporter has {len(automation.reporter.get_results())} results")
+            logger.info(f"🔧 Automation completed for {search_record.name}, status: {result.get('status')}")
+            logger.info(f"📋 Results data: {result}")
             
-            if success:
-                # Get results from the reporter
-                results_data = automation.reporter.get_results()
-                logger.info(f"📋 Results data: {results_data}")
+            if result.get('status') != 'Error':
+                # Extract detailed match information
+                match_details = result.get('match_details', [])
+                total_matches = result.get('matches_found', 0)
                 
-                if results_data and len(results_data) > 0:
-                    result = results_data[0]  # Get the first (and only) result
+                # Prepare detailed results and count match types in one pass
+                detailed_results = []
+                exact_matches = partial_matches = 0
+                for detail in match_details:
+                    match_type = detail.get('match_type')
+                    if match_type == 'exact':
+                        exact_matches += 1
+                    elif match_type == 'partial':
+                        partial_matches += 1
                     
-                    # Extract detailed match information
-                    match_details = result.get('match_details', [])
-                    exact_matches = len([d for d in match_details if d.get('match_type') == 'exact'])
-                    partial_matches = len([d for d in match_details if d.get('match_type') == 'partial'])
-                    total_matches = result.get('matches_found', 0)
+                    # Apply advanced matching to get detailed reasoning
+                    matched_name = detail.get('matched_name', '')
+                    advanced_match = match_names_cached(search_record.name, matched_name)
                     
-                    # Prepare detailed results for API response
-                    detailed_results = []
-                    for detail in match_details:
-                        # Apply advanced matching to get detailed reasoning
-                        advanced_match = self.advanced_matcher.match_names(
-                            search_record.name, 
-                            detail.get('matched_name', '')
-                        )
-                        
-                        detailed_results.append({
-                            "name": detail.get('matched_name', ''),
-                            "match_category": advanced_match.get_display_category(),
-                            "match_reasoning": advanced_match.reasoning,
-                            "confidence": advanced_match.confidence,
-                            "date_of_birth": detail.get('date_of_birth', ''),
-                            "location": detail.get('location', '')
-                        })
-                    
-                    # Determine overall match status
-                    if exact_matches > 0:
-                        overall_status = "Match"
-                        overall_category = "EXACT MATCH"
-                        main_reasoning = f"Found {exact_matches} exact matches"
-                    elif partial_matches > 0:
-                        overall_status = "Match"
-                        overall_category = "PARTIAL MATCH"
-                        main_reasoning = f"Found {partial_matches} partial matches"
-                    elif total_matches > 0:
-                        overall_status = "Match"
-                        overall_category = "PARTIAL MATCH"
-                        main_reasoning = f"Found {total_matches} matches"
-                    else:
-                        overall_status = "No Match"
-                        overall_category = "NOT MATCHED"
-                        main_reasoning = "No meaningful matches found"
-                    
-                    return {
-                        "status": overall_status,
-                        "matches_found": total_matches,
-                        "exact_matches": exact_matches,
-                        "partial_matches": partial_matches,
-                        "match_category": overall_category,
-                        "match_reasoning": main_reasoning,
-                        "detailed_results": detailed_results,
-                        "search_duration": search_duration,
-                        "total_results": result.get('total_results', 0)
-                    }
+                    detailed_results.append({
+                        "name": matched_name,
+                        "match_category": advanced_match.get_display_category(),
+                        "match_reasoning": advanced_match.reasoning,
+                        "confidence": advanced_match.confidence,
+                        "date_of_birth": detail.get('date_of_birth', ''),
+                        "location": detail.get('location', '')
+                    })
+                
+                # Determine overall match status
+                if exact_matches > 0:
+                    overall_status = "Match"
+                    overall_category = "EXACT MATCH"
+                    main_reasoning = f"Found {exact_matches} exact matches"
+                elif partial_matches > 0:
+                    overall_status = "Match"
+                    overall_category = "PARTIAL MATCH"
+                    main_reasoning = f"Found {partial_matches} partial matches"
+                elif total_matches > 0:
+                    overall_status = "Match"
+                    overall_category = "PARTIAL MATCH"
+                    main_reasoning = f"Found {total_matches} matches"
                 else:
-                    return {
-                        "status": "No Match",
-                        "matches_found": 0,
-                        "exact_matches": 0,
-                        "partial_matches": 0,
-                        "match_category": "NOT MATCHED",
-                        "match_reasoning": "No results found during search",
-                        "detailed_results": [],
-                        "search_duration": search_duration,
-                        "total_results": 0
-                    }
+                    overall_status = "No Match"
+                    overall_category = "NOT MATCHED"
+                    main_reasoning = "No meaningful matches found"
+                
+                return {
+                    "status": overall_status,
+                    "matches_found": total_matches,
+                    "exact_matches": exact_matches,
+                    "partial_matches": partial_matches,
+                    "match_category": overall_category,
+                    "match_reasoning": main_reasoning,
+                    "detailed_results": detailed_results,
+                    "search_duration": search_duration,
+                    "total_results": result.get('total_results', 0)
+                }
             else:
-                logger.error(f"❌ Automation returned success=False for {search_record.name}")
-                # Still check if there are any results even if success=False
-                results_data = automation.reporter.get_results()
-                logger.info(f"📋 Even though success=False, reporter has {len(results_data)} results")
+                logger.error(f"❌ Automation failed for {search_record.name}: {result.get('error')}")
                 
                 return {
                     "status": "Error",
@@ -184,7 +265,7 @@ class ProductionAutomationEngine:
                     "match_reasoning": "Automation failed to complete",
                     "detailed_results": [],
                     "search_duration": search_duration,
-                    "error": "Real automation failed"
+                    "error": result.get('error', 'Real automation failed')
                 }
                 
         except Exception as e:
@@ -207,7 +288,7 @@ automation_engine = ProductionAutomationEngine()
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'message': 'PRODUCTION ReadySearch API Server with REAL Automation',
@@ -230,52 +311,39 @@ def start_automation():
         config = data.get('config', {})
         
         if not names:
-            return jsonify({'error': 'No names provided'}), 400
+            return json_response({'error': 'No names provided'}), 400
         
-        # Parse names with birth years
-        search_records = []
-        for name_entry in names:
-            if ',' in name_entry:
-                parts = name_entry.split(',', 1)
-                name = parts[0].strip()
-                try:
-                    birth_year = int(parts[1].strip())
-                    search_records.append(SearchRecord(name=name, birth_year=birth_year))
-                except ValueError:
-                    search_records.append(SearchRecord(name=name_entry))
-            else:
-                search_records.append(SearchRecord(name=name_entry))
+        # Parse names with birth years into parallel lists with the same parser as the CLIs;
+        # SearchRecords are only built by the worker as each search starts
+        parsed_entries = [entry for name_entry in names for entry in parse_name_entries(name_entry)]
+        if not parsed_entries:
+            return json_response({'error': 'No valid names provided'}), 400
+        search_names = [name for name, _ in parsed_entries]
+        birth_years = [birth_year for _, birth_year in parsed_entries]
         
         # Create session
         session_id = str(uuid.uuid4())
-        session_data = {
-            'session_id': session_id,
-            'search_records': [{'name': sr.name, 'birth_year': sr.birth_year} for sr in search_records],
-            'config': config,
-            'status': 'started',
-            'created_at': datetime.now().isoformat(),
-            'total_names': len(search_records),
-            'processed_names': 0,
-            'current_name': '',
-            'current_index': 0,
-            'results': []
-        }
+        session = Session(
+            session_id=session_id,
+            search_records=[{'name': n, 'birth_year': y} for n, y in zip(search_names, birth_years)],
+            config=config,
+            created_at=datetime.now().isoformat(),
+            total_names=len(search_names)
+        )
+        active_sessions[session_id] = session
         
-        active_sessions[session_id] = session_data
-        session_results[session_id] = []
+        logger.info(f"Started PRODUCTION automation session {session_id} with {len(search_names)} names")
         
-        logger.info(f"Started PRODUCTION automation session {session_id} with {len(search_records)} names")
+        # Start background processing with REAL automation on the shared loop
+        session.future = asyncio.run_coroutine_threadsafe(
+            process_production_automation(session_id, search_names, birth_years, config),
+            automation_loop
+        )
         
-        # Start background processing with REAL automation
-        threading.Thread(
-            target=lambda: asyncio.run(process_production_automation(session_id, search_records, config)),
-            daemon=True
-        ).start()
-        
-        return jsonify({
+        return json_response({
             'session_id': session_id,
             'status': 'started',
-            'total_names': len(search_records),
+            'total_names': len(search_names),
             'message': 'PRODUCTION automation session created - using REAL readysearch.com.au',
             'features': [
                 'REAL automation with genuine search results',
@@ -287,48 +355,94 @@ def start_automation():
         
     except Exception as e:
         logger.error(f"Error starting PRODUCTION automation: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
-async def process_production_automation(session_id: str, search_records: List[SearchRecord], config: Dict[str, Any]):
+async def process_production_automation(session_id: str, search_names: List[str], birth_years: List[Optional[int]],
+                                        config: Dict[str, Any]):
     """Process automation in background with REAL ReadySearch automation."""
     try:
         session = active_sessions[session_id]
         delay = config.get('delay', 2.5)
+        # Searches start at most once per `delay` seconds; time spent inside a
+        # search counts toward that budget instead of idling after every one
+        throttler = Throttler(rate_limit=1, period=delay)
         
-        for i, search_record in enumerate(search_records):
-            # Update session status
-            session['current_name'] = search_record.name
-            session['processed_names'] = i
-            session['current_index'] = i
-            
-            logger.info(f"Processing {search_record.name} with REAL automation...")
-            
-            # Run REAL automation search with session config
-            result = await automation_engine.run_search(search_record, config)
+        # Small pool of browsers per session; each search borrows one, so
+        # several records are in flight while others wait on the site
+        concurrency = max(1, min(int(config.get('concurrency', DEFAULT_SESSION_CONCURRENCY)), len(search_names)))
+        opened = await asyncio.gather(
+            *(automation_engine.open_automation(config) for _ in range(concurrency)),
+            return_exceptions=True
+        )
+        automations = [a for a in opened if not isinstance(a, BaseException)]
+        available = asyncio.Queue()
+        for automation in automations:
+            available.put_nowait(automation)
+        
+        # Clients read results positionally, so finished searches are held
+        # back until every earlier record has been published
+        finished = {}
+        next_index = 0
+        
+        async def process_record(index: int):
+            nonlocal next_index
+            search_record = SearchRecord(name=search_names[index], birth_year=birth_years[index])
+            automation = await available.get()
+            try:
+                # Update session status
+                with session.lock:
+                    session.current_name = search_record.name
+                    session.current_index = index
+                
+                logger.info(f"Processing {search_record.name} with REAL automation...")
+                
+                # Run REAL automation search on a pooled browser
+                async with throttler:
+                    result = await automation_engine.run_search(search_record, automation)
+            finally:
+                available.put_nowait(automation)
             
             # Store result
             result['name'] = search_record.name
             result['timestamp'] = datetime.now().isoformat()
-            session['results'].append(result)
-            session_results[session_id].append(result)
             
-            logger.info(f"Completed {search_record.name}: {result['status']} - {result['match_category']}")
+            with session.lock:
+                session.processed_names += 1
+                finished[index] = result
+                while next_index in finished:
+                    session.results.append(finished.pop(next_index))
+                    next_index += 1
+                session.lock.notify_all()
             
-            # Realistic delay between searches
-            await asyncio.sleep(delay)
+            logger.info(f"Completed {search_record.name}: {result['status']} - {result['match_category']}")
         
-        # Mark session as completed
-        session['status'] = 'completed'
-        session['completed_at'] = datetime.now().isoformat()
-        session['processed_names'] = len(search_records)
-        session['current_index'] = len(search_records)
+        try:
+            if not automations:
+                raise opened[0]
+            logger.info(f"Session {session_id} running {len(automations)} concurrent browsers")
+            await asyncio.gather(*(process_record(i) for i in range(len(search_names))))
+        finally:
+            await asyncio.gather(*(a.close() for a in automations))
+        
+        # Mark session as completed, unless it was stopped while the last searches finished
+        with session.lock:
+            if session.status == 'stopped':
+                return
+            session.status = 'completed'
+            session.completed_at = datetime.now().isoformat()
+            session.processed_names = len(search_names)
+            session.current_index = len(search_names)
+            session.lock.notify_all()
         
         logger.info(f"PRODUCTION automation session {session_id} completed successfully")
         
     except Exception as e:
         logger.error(f"Error in PRODUCTION automation processing: {str(e)}")
-        session['status'] = 'error'
-        session['error'] = str(e)
+        with session.lock:
+            if session.status != 'stopped':
+                session.status = 'error'
+                session.error = str(e)
+            session.lock.notify_all()
 
 @app.route('/api/session/<session_id>/status', methods=['GET'])
 def get_session_status(session_id):
@@ -336,20 +450,54 @@ def get_session_status(session_id):
     try:
         session = active_sessions.get(session_id)
         if not session:
-            return jsonify({'error': 'Session not found'}), 404
+            return json_response({'error': 'Session not found'}), 404
         
-        # Add current timestamp
-        session['last_checked'] = datetime.now().isoformat()
+        # Clients that already hold the first N results can pass ?since=N to get the rest
+        data = session.to_dict(since=request.args.get('since', 0, type=int))
         
-        # Include detailed results if available
-        if session_id in session_results:
-            session['detailed_results'] = session_results[session_id]
+        # Stamp the response rather than writing to the shared session on every poll
+        data['last_checked'] = datetime.now().isoformat()
         
-        return jsonify(session)
+        return json_response(data)
         
     except Exception as e:
         logger.error(f"Error getting session status: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
+
+@app.route('/api/session/<session_id>/events', methods=['GET'])
+def stream_session_events(session_id):
+    """Stream session results as Server-Sent Events while the session runs."""
+    session = active_sessions.get(session_id)
+    if not session:
+        return json_response({'error': 'Session not found'}), 404
+    
+    since = request.args.get('since', 0, type=int)
+    
+    def generate():
+        sent = since
+        while True:
+            with session.lock:
+                session.lock.wait_for(
+                    lambda: len(session.results) > sent or session.finished,
+                    timeout=SSE_KEEPALIVE_SECONDS
+                )
+                new_results = session.results[sent:]
+                status = session.status
+                processed = session.processed_names
+                finished = session.finished
+            
+            for result in new_results:
+                yield f"event: result\ndata: {_dumps(result)}\n\n"
+            sent += len(new_results)
+            
+            if finished:
+                yield f"event: status\ndata: {_dumps({'status': status, 'processed_names': processed})}\n\n"
+                return
+            if not new_results:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 @app.route('/api/session/<session_id>/stop', methods=['POST'])
 def stop_session(session_id):
@@ -357,25 +505,37 @@ def stop_session(session_id):
     try:
         session = active_sessions.get(session_id)
         if not session:
-            return jsonify({'error': 'Session not found'}), 404
+            return json_response({'error': 'Session not found'}), 404
         
-        session['status'] = 'stopped'
-        session['stopped_at'] = datetime.now().isoformat()
+        with session.lock:
+            session.status = 'stopped'
+            session.stopped_at = datetime.now().isoformat()
+            session.lock.notify_all()
+        
+        # Cancel in-flight searches; the worker closes its browsers on the way out
+        if session.future:
+            session.future.cancel()
         
         logger.info(f"Stopped PRODUCTION session {session_id}")
         
-        return jsonify({'status': 'stopped', 'message': 'Session stopped successfully'})
+        return json_response({'status': 'stopped', 'message': 'Session stopped successfully'})
         
     except Exception as e:
         logger.error(f"Error stopping session: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 @app.route('/api/sessions', methods=['GET'])
 def list_sessions():
-    """List all active sessions."""
+    """List all active sessions (pass ?include=results for full session data)."""
     try:
-        return jsonify({
-            'sessions': list(active_sessions.values()),
+        sessions = list(active_sessions.values())
+        if request.args.get('include') == 'results':
+            session_data = [session.to_dict() for session in sessions]
+        else:
+            session_data = [session.summary() for session in sessions]
+        
+        return json_response({
+            'sessions': session_data,
             'total_sessions': len(active_sessions),
             'features': [
                 'PRODUCTION automation with REAL readysearch.com.au searches',
@@ -386,7 +546,7 @@ def list_sessions():
         })
     except Exception as e:
         logger.error(f"Error listing sessions: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}), 500
 
 if __name__ == '__main__':
     print("========================================")
@@ -406,8 +566,18 @@ if __name__ == '__main__':
     print(f"📡 API endpoints available:")
     print(f"   POST /api/start-automation")
     print(f"   GET  /api/session/<id>/status")
+    print(f"   GET  /api/session/<id>/events")
     print(f"   POST /api/session/<id>/stop")
     print(f"   GET  /api/sessions")
     print("========================================")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Werkzeug's reloading debug server only when explicitly asked for
+    if os.environ.get('READYSEARCH_API_DEV'):
+        app.run(host='0.0.0.0', port=5000, debug=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=5000, threads=WSGI_THREADS)
+        except ImportError:
+            print("⚠️ waitress not installed - falling back to Flask's threaded server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
@@ -3,287 +3,333 @@
 PRODUCTION CLI - Final working version with direct selector usage
 """
 
+import argparse
 import asyncio
+import json
+import os
 import sys
 import logging
 import time
 from pathlib import Path
 from datetime import datetime
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser, TimeoutError as PlaywrightTimeoutError
 
 # Add current directory to path
 sys.path.append(str(Path(__file__).parent))
 
 from config import Config
 from readysearch_automation.input_loader import SearchRecord
-from readysearch_automation.advanced_name_matcher import AdvancedNameMatcher, MatchType
+from readysearch_automation.advanced_name_matcher import MatchType, match_names_strict_cached
+from readysearch_automation.text_parsing import parse_name_entries, parse_result_row
+
+# Searches run at once on the shared browser unless --concurrency says otherwise
+DEFAULT_CONCURRENCY = 3
+
+# Match details kept per search unless --max-matches says otherwise; every row is still counted
+DEFAULT_MAX_MATCHES = 50
+
+# Ceiling on one whole search in seconds unless --per-search-timeout says otherwise
+DEFAULT_SEARCH_TIMEOUT = 30
+
+# Seconds to keep watching for the multiple-records popup after the results page has loaded
+POPUP_GRACE_SECONDS = 1.0
+
+# Cookies/local storage from a previous run, so new contexts skip first-visit setup
+STORAGE_STATE_PATH = Path(__file__).parent / '.rs_state.json'
+
+# Headless Chromium flags that cut background work, subprocesses and memory per browser
+BROWSER_ARGS = [
+    '--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu',
+    '--disable-background-networking', '--disable-sync', '--disable-extensions',
+    '--disable-default-apps', '--disable-translate', '--metrics-recording-only',
+    '--no-first-run', '--disable-renderer-backgrounding', '--disable-ipc-flooding-protection'
+]
+
+# Analytics/ad hosts; scripts from the site itself still load so the form works
+BLOCKED_URL_FRAGMENTS = ('google-analytics', 'googletagmanager', 'doubleclick', 'gtag/js', 'facebook')
+
+async def block_unneeded_requests(route):
+    """Abort static assets and third-party trackers"""
+    request = route.request
+    if request.resource_type in Config.BLOCKED_RESOURCE_TYPES or any(f in request.url for f in BLOCKED_URL_FRAGMENTS):
+        await route.abort()
+    else:
+        await route.continue_()
 
 class ProductionCLI:
     """Production CLI with direct selector usage and verified performance"""
     
-    def __init__(self):
+    def __init__(self, max_matches: int = DEFAULT_MAX_MATCHES, verbose: bool = False,
+                 per_search_timeout: float = DEFAULT_SEARCH_TIMEOUT):
         self.config = Config.get_config()
-        self.matcher = AdvancedNameMatcher()
+        self.max_matches = max_matches
+        self.per_search_timeout = per_search_timeout
+        self._storage_state_saved = False
+        self._storage_state_unusable = False
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        # Set up logging; per-row extraction details are only logged with verbose
+        logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
         self.logger = logging.getLogger(__name__)
         
-    async def search_person(self, search_record: SearchRecord) -> dict:
+    async def start_browser(self, cdp_endpoint: str = None, single_process: bool = False):
+        """Start Playwright and launch (or connect to) the shared browser; returns (playwright, browser)"""
+        playwright = await async_playwright().start()
+        try:
+            if cdp_endpoint:
+                # Reuse a long-lived browser; closing it later only disconnects
+                print(f"🔌 Connecting to browser at {cdp_endpoint}...")
+                return playwright, await playwright.chromium.connect_over_cdp(cdp_endpoint)
+            return playwright, await self.launch_browser(playwright, single_process)
+        except Exception:
+            await playwright.stop()
+            raise
+    
+    async def launch_browser(self, playwright, single_process: bool = False) -> Browser:
+        """Launch the browser that every search of a run shares"""
+        print("🚀 Launching browser...")
+        args = BROWSER_ARGS + ['--single-process'] if single_process else BROWSER_ARGS
+        return await playwright.chromium.launch(
+            headless=True,  # SPEED: No GUI
+            args=args
+        )
+    
+    async def search_person(self, search_record: SearchRecord, browser: Browser) -> dict:
         """
         Search for a person using direct selector approach
         
         Args:
             search_record: SearchRecord with name and optional birth year
+            browser: Shared browser from launch_browser(); each search gets its own context
             
         Returns:
             Dictionary with search results
         """
         start_time = time.time()
         
-        print(f"🎯 Searching for: {search_record.name}")
+        self.logger.debug(f"[{search_record.name}] 🎯 Searching")
         if search_record.birth_year:
-            print(f"📅 Birth year: {search_record.birth_year} (searching {search_record.birth_year-2} to {search_record.birth_year+2})")
+            self.logger.debug(f"[{search_record.name}] 📅 Birth year: {search_record.birth_year} (searching {search_record.birth_year-2} to {search_record.birth_year+2})")
+        
+        try:
+            # Hard ceiling on the whole search, whatever its individual step timeouts add up to
+            results = await asyncio.wait_for(
+                self._do_search(search_record, browser), timeout=self.per_search_timeout or None
+            )
+        except asyncio.TimeoutError:
+            error = f"Search exceeded the {self.per_search_timeout}s limit"
+        except Exception as e:
+            error = str(e)
+        else:
+            search_duration = time.time() - start_time
+            results['search_duration'] = search_duration
+            
+            # One line per search, so concurrent searches don't interleave their output
+            print(f"📈 {search_record.name}: {results['matches_found']} matches in {search_duration:.2f}s")
+            return results
         
-        async with async_playwright() as p:
+        search_duration = time.time() - start_time
+        print(f"❌ {search_record.name}: error during search: {error}")
+        
+        return {
+            'name': search_record.name,
+            'status': 'Error',
+            'error': error,
+            'search_duration': search_duration,
+            'matches_found': 0,
+            'exact_matches': 0,
+            'partial_matches': 0,
+            'match_category': 'ERROR',
+            'match_reasoning': f'Search failed: {error}',
+            'detailed_results': []
+        }
+    
+    async def _new_context(self, browser: Browser):
+        """Open a context seeded with the saved storage state, falling back to a clean one if it is unusable"""
+        if STORAGE_STATE_PATH.exists() and not self._storage_state_unusable:
             try:
-                # Launch browser with optimized settings
-                print("🚀 Launching browser...")
-                browser = await p.chromium.launch(
-                    headless=True,  # SPEED: No GUI
-                    args=['--no-sandbox', '--disable-dev-shm-usage', '--disable-gpu']
-                )
-                context = await browser.new_context()
-                page = await context.new_page()
-                
-                # Navigate to ReadySearch
-                print("🌐 Navigating to ReadySearch...")
-                await page.goto("https://readysearch.com.au/products?person", timeout=15000, wait_until="networkidle")
-                print("✅ Page loaded")
-                
-                # DIRECT SELECTOR USAGE - No complex search logic
-                print("🔍 Finding search input...")
-                name_input = await page.wait_for_selector('input[name="search"]', timeout=5000)
-                print("✅ Found name input field")
-                
-                # Enter name
-                print(f"⌨️ Entering name: {search_record.name}")
-                await name_input.click()
-                await name_input.fill(search_record.name)
-                print("✅ Name entered")
+                return await browser.new_context(storage_state=str(STORAGE_STATE_PATH))
+            except Exception as e:
+                # Stale or corrupt state would fail every search: stop using it until this run saves a fresh one
+                self.logger.warning(f"Ignoring unusable browser storage state: {e}")
+                self._storage_state_unusable = True
+        return await browser.new_context()
+    
+    async def _do_search(self, search_record: SearchRecord, browser: Browser) -> dict:
+        """Run the search steps in a fresh context, closing it however the search ends"""
+        context = popup_task = nav_task = None
+        try:
+            # Fresh context per search on the shared browser, seeded with saved cookies
+            context = await self._new_context(browser)
+            await context.route("**/*", block_unneeded_requests)
+            page = await context.new_page()
+            
+            # Navigate to ReadySearch
+            self.logger.debug(f"[{search_record.name}] 🌐 Navigating to ReadySearch...")
+            # The form is ready once its input exists; no need to wait for the network to go quiet
+            await page.goto("https://readysearch.com.au/products?person", timeout=15000, wait_until="domcontentloaded")
+            self.logger.debug(f"[{search_record.name}] ✅ Page loaded")
+            
+            # Enter name; page.fill waits for the input, focuses it and fills it in one call
+            self.logger.debug(f"[{search_record.name}] ⌨️ Entering name")
+            await page.fill('input[name="search"]', search_record.name, timeout=5000)
+            self.logger.debug(f"[{search_record.name}] ✅ Name entered")
+            
+            # Set birth year range if provided
+            if search_record.birth_year:
+                start_year = search_record.birth_year - 2
+                end_year = search_record.birth_year + 2
                 
-                # Set birth year range if provided
-                if search_record.birth_year:
-                    start_year = search_record.birth_year - 2
-                    end_year = search_record.birth_year + 2
-                    
-                    print(f"📅 Setting birth year range: {start_year} to {end_year}")
-                    
-                    # Start year
-                    start_select = await page.wait_for_selector('select[name="yobs"]', timeout=3000)
-                    await start_select.select_option(str(start_year))
-                    print(f"✅ Start year set to {start_year}")
-                    
-                    # End year  
-                    end_select = await page.wait_for_selector('select[name="yobe"]', timeout=3000)
-                    await end_select.select_option(str(end_year))
-                    print(f"✅ End year set to {end_year}")
+                self.logger.debug(f"[{search_record.name}] 📅 Setting birth year range: {start_year} to {end_year}")
                 
-                # Submit search
-                print("🚀 Submitting search...")
+                # The two dropdowns are independent, so set them concurrently
+                await asyncio.gather(
+                    page.select_option('select[name="yobs"]', str(start_year), timeout=3000),
+                    page.select_option('select[name="yobe"]', str(end_year), timeout=3000)
+                )
+                self.logger.debug(f"[{search_record.name}] ✅ Birth year range set to {start_year}-{end_year}")
+            
+            # Submit search; result rows are in the results page's HTML, so its
+            # DOM being parsed is enough (background requests never settle)
+            async with page.expect_navigation(wait_until="domcontentloaded", timeout=30000) as nav_info:
+                self.logger.debug(f"[{search_record.name}] 🚀 Submitting search...")
                 submit_button = await page.wait_for_selector('.sch_but', timeout=3000)
                 await submit_button.click()
-                print("✅ Search submitted")
-                
-                # Handle popup if it appears
-                try:
-                    await page.wait_for_selector('text="ONE PERSON MAY HAVE MULTIPLE RECORDS"', timeout=3000)
-                    print("📋 Handling popup...")
-                    await page.keyboard.press('Enter')  # Accept popup
-                    print("✅ Popup handled")
-                except:
-                    print("ℹ️ No popup appeared")
-                
-                # Wait for results page
-                print("⏳ Waiting for results...")
-                await page.wait_for_load_state('networkidle', timeout=30000)
-                print("✅ Results page loaded")
-                
-                # Extract results
-                print("📊 Extracting results...")
-                results = await self.extract_results(page, search_record)
+                self.logger.debug(f"[{search_record.name}] ✅ Search submitted")
                 
-                search_duration = time.time() - start_time
-                results['search_duration'] = search_duration
-                
-                print(f"📈 Search completed in {search_duration:.2f}s")
-                print(f"📊 Found {results['matches_found']} matches")
+                # Watch for the popup from submission on and race it against the results
+                # navigation rather than blocking on a fixed timeout when there is no popup
+                popup_task = asyncio.ensure_future(
+                    page.wait_for_selector('text="ONE PERSON MAY HAVE MULTIPLE RECORDS"', timeout=15000)
+                )
+                nav_task = asyncio.ensure_future(nav_info.value)
+                await asyncio.wait({popup_task, nav_task}, return_when=asyncio.FIRST_COMPLETED)
                 
-                await browser.close()
-                return results
-                
-            except Exception as e:
-                search_duration = time.time() - start_time
-                print(f"❌ Error during search: {str(e)}")
+                popup_handled = await self._accept_popup(page, popup_task, search_record)
                 
+                self.logger.debug(f"[{search_record.name}] ⏳ Waiting for results...")
+            self.logger.debug(f"[{search_record.name}] ✅ Results page loaded")
+            
+            # The popup can also open once the results document has loaded: give it a short grace period
+            if not popup_task.done():
+                await asyncio.wait({popup_task}, timeout=POPUP_GRACE_SECONDS)
+                popup_handled = await self._accept_popup(page, popup_task, search_record)
+            if not popup_handled:
+                self.logger.debug(f"[{search_record.name}] ℹ️ No popup appeared")
+            
+            # Result rows can render after DOMContentLoaded: wait for them or a no-records message,
+            # so a slow page is reported as an error rather than as no matches
+            try:
+                await page.wait_for_selector(Config.RESULTS_READY_SELECTOR, timeout=Config.RESULTS_TIMEOUT)
+            except PlaywrightTimeoutError:
+                raise RuntimeError(
+                    f"Results did not appear within {Config.RESULTS_TIMEOUT / 1000:.0f}s of submitting the search"
+                ) from None
+            self.logger.debug(f"[{search_record.name}] ✅ Results ready")
+            
+            # Extract results
+            self.logger.debug(f"[{search_record.name}] 📊 Extracting results...")
+            results = await self.extract_results(page, search_record)
+            
+            # Persist cookies once per run after the site has been through a full search
+            if not self._storage_state_saved and results['status'] != 'Error':
+                self._storage_state_saved = True
                 try:
-                    await browser.close()
-                except:
+                    state = await context.storage_state()
+                    await asyncio.to_thread(_write_storage_state, state)
+                    self._storage_state_unusable = False
+                except Exception as e:
+                    self.logger.warning(f"Could not save browser storage state: {e}")
+            
+            return results
+        
+        finally:
+            # Cancel whichever of the raced waits is still pending; retrieve the outcome of
+            # finished ones so a failed wait isn't reported as "Task exception was never retrieved"
+            for task in (popup_task, nav_task):
+                if task and not task.cancel() and not task.cancelled():
+                    task.exception()
+            if context:
+                try:
+                    await context.close()
+                except Exception:
                     pass
-                
-                return {
-                    'name': search_record.name,
-                    'status': 'Error',
-                    'error': str(e),
-                    'search_duration': search_duration,
-                    'matches_found': 0,
-                    'exact_matches': 0,
-                    'partial_matches': 0,
-                    'match_category': 'ERROR',
-                    'match_reasoning': f'Search failed: {str(e)}',
-                    'detailed_results': []
-                }
+    
+    async def _accept_popup(self, page, popup_task: asyncio.Future, search_record: SearchRecord) -> bool:
+        """Accept the multiple-records popup if popup_task has seen it; returns whether it did"""
+        if not popup_task.done() or popup_task.cancelled() or popup_task.exception():
+            return False
+        self.logger.debug(f"[{search_record.name}] 📋 Handling popup...")
+        await page.keyboard.press('Enter')  # Accept popup
+        self.logger.debug(f"[{search_record.name}] ✅ Popup handled")
+        return True
     
     async def extract_results(self, page, search_record: SearchRecord) -> dict:
         """Extract results from the results page"""
         
         try:
-            # Look for result rows
-            result_rows = await page.query_selector_all('tr')
-            print(f"📋 Found {len(result_rows)} table rows")
+            # One round-trip for every row's text; header/navigation rows are dropped
+            # in the page so only "Date of Birth:" rows come back over CDP
+            row_count, row_texts = await page.eval_on_selector_all(
+                'tr',
+                '(rows) => [rows.length, rows.map(r => r.innerText).filter(t => t.includes("Date of Birth:"))]'
+            )
+            self.logger.debug(f"[{search_record.name}] 📋 Found {row_count} table rows ({len(row_texts)} with a date of birth)")
             
             detailed_results = []
-            matches_found = 0
+            matches_found = exact_matches = partial_matches = 0
+            
+            exact_first_name = getattr(search_record, 'exact_matching', False)
             
-            for i, row in enumerate(result_rows):
+            for i, row_text in enumerate(row_texts):
                 try:
-                    # Extract text from row
-                    row_text = await row.inner_text()
-                    
                     # Print first few rows for debugging
                     if i < 15:
-                        print(f"   🔍 Row {i+1}: {row_text[:100]}...")
+                        self.logger.debug(f"[{search_record.name}]    🔍 Row {i+1}: {row_text[:100]}...")
                     
-                    # Skip obviously irrelevant rows
-                    if not row_text.strip():
+                    # Look for ReadySearch result patterns, e.g.
+                    # "ANDRO CUTUK | Date of Birth: 12/06/1975	SYDNEY NSW |"
+                    # "ANDRO CUTUK\nDate of Birth: 12/06/1975	SYDNEY NSW"
+                    parsed_row = parse_result_row(row_text)
+                    if not parsed_row:
                         continue
                     
-                    # Look for ReadySearch result patterns
-                    # Example: "ANDRO CUTUK | Date of Birth: 12/06/1975	SYDNEY NSW |"
+                    self.logger.debug(f"[{search_record.name}]    🎯 Found result row {i+1}: {row_text.strip()}")
+                    name_part, date_match = parsed_row
+                    self.logger.debug(f"[{search_record.name}]       📝 Extracted: Name='{name_part}', Date='{date_match}'")
                     
-                    # Check if this row contains a person's name and birth date
-                    row_text_clean = row_text.strip()
+                    # Use STRICT advanced matcher to enforce last name exact matching
+                    match_result = match_names_strict_cached(search_record.name, name_part, exact_first_name)
                     
-                    # Look for "Date of Birth:" pattern which indicates a result
-                    if "Date of Birth:" in row_text_clean:
-                        print(f"   🎯 Found result row {i+1}: {row_text_clean}")
+                    if match_result.match_type != MatchType.NOT_MATCHED:
+                        matches_found += 1
+                        display_category = match_result.get_display_category()
+                        if 'EXACT' in display_category:
+                            exact_matches += 1
+                        elif 'PARTIAL' in display_category:
+                            partial_matches += 1
+                        detailed_results.append({
+                            'matched_name': name_part,
+                            'date_of_birth': date_match,
+                            'match_type': display_category,
+                            'match_reasoning': match_result.reasoning,
+                            'confidence': match_result.confidence
+                        })
                         
-                        # Extract name and date from the pattern
-                        if "|" in row_text_clean:
-                            # Split by pipe separators
-                            parts = row_text_clean.split("|")
-                            
-                            for part in parts:
-                                part = part.strip()
-                                if "Date of Birth:" in part:
-                                    # Find the name (should be in a previous part or same part)
-                                    name_part = ""
-                                    date_part = part
-                                    
-                                    # Look for name in previous parts
-                                    for prev_part in parts:
-                                        prev_part = prev_part.strip()
-                                        if prev_part and "Date of Birth:" not in prev_part and len(prev_part) > 2:
-                                            # Check if this looks like a name
-                                            if prev_part.replace(' ', '').replace('-', '').replace('.', '').isalpha():
-                                                name_part = prev_part
-                                                break
-                                    
-                                    # Extract date from "Date of Birth: XX/XX/XXXX"
-                                    date_match = ""
-                                    if "Date of Birth:" in date_part:
-                                        date_text = date_part.split("Date of Birth:")[1].strip()
-                                        # Extract just the date part (before any location info)
-                                        date_match = date_text.split()[0] if date_text else ""
-                                    
-                                    if name_part:
-                                        print(f"      📝 Extracted: Name='{name_part}', Date='{date_match}'")
-                                        
-                                        # Use STRICT advanced matcher to enforce last name exact matching
-                                        exact_first_name = getattr(search_record, 'exact_matching', False)
-                                        match_result = self.matcher.match_names_strict(search_record.name, name_part, exact_first_name)
-                                        
-                                        if match_result.match_type != MatchType.NOT_MATCHED:
-                                            matches_found += 1
-                                            detailed_results.append({
-                                                'matched_name': name_part,
-                                                'date_of_birth': date_match,
-                                                'match_type': match_result.get_display_category(),
-                                                'match_reasoning': match_result.reasoning,
-                                                'confidence': match_result.confidence
-                                            })
-                                            
-                                            print(f"      ✅ MATCH {matches_found}: {name_part} ({match_result.get_display_category()}) - {match_result.reasoning}")
-                                        else:
-                                            print(f"      ❌ No match: {name_part} - {match_result.reasoning}")
-                                    break
-                        else:
-                            # Alternative pattern without pipes
-                            # Try to extract name and date from the line
-                            if "Date of Birth:" in row_text_clean:
-                                # Look for lines like: "ANDRO CUTUK\nDate of Birth: 12/06/1975\tSYDNEY NSW"
-                                lines = row_text_clean.split('\n')
-                                
-                                for i, line in enumerate(lines):
-                                    if "Date of Birth:" in line:
-                                        # The name should be in the previous line or beginning of this line
-                                        name_candidates = []
-                                        
-                                        # Check previous line
-                                        if i > 0:
-                                            prev_line = lines[i-1].strip()
-                                            if prev_line and len(prev_line) > 2 and prev_line.replace(' ', '').replace('-', '').isalpha():
-                                                name_candidates.append(prev_line)
-                                        
-                                        # Check if name is at the beginning of current line
-                                        if line.split("Date of Birth:")[0].strip():
-                                            candidate = line.split("Date of Birth:")[0].strip()
-                                            if len(candidate) > 2 and candidate.replace(' ', '').replace('-', '').isalpha():
-                                                name_candidates.append(candidate)
-                                        
-                                        # Extract date
-                                        date_part = line.split("Date of Birth:")[1].strip().split()[0] if "Date of Birth:" in line else ""
-                                        
-                                        # Process each name candidate
-                                        for potential_name in name_candidates:
-                                            if potential_name and len(potential_name) <= 50:  # Reasonable name length
-                                                print(f"      📝 Clean extraction: Name='{potential_name}', Date='{date_part}'")
-                                                
-                                                # Use STRICT matching with user preference
-                                                exact_first_name = getattr(search_record, 'exact_matching', False)
-                                                match_result = self.matcher.match_names_strict(search_record.name, potential_name, exact_first_name)
-                                                
-                                                if match_result.match_type != MatchType.NOT_MATCHED:
-                                                    matches_found += 1
-                                                    detailed_results.append({
-                                                        'matched_name': potential_name,
-                                                        'date_of_birth': date_part,
-                                                        'match_type': match_result.get_display_category(),
-                                                        'match_reasoning': match_result.reasoning,
-                                                        'confidence': match_result.confidence
-                                                    })
-                                                    
-                                                    print(f"      ✅ MATCH {matches_found}: {potential_name} ({match_result.get_display_category()})")
-                                                break  # Only take first valid match per row
+                        self.logger.debug(f"[{search_record.name}]       ✅ MATCH {matches_found}: {name_part} ({display_category}) - {match_result.reasoning}")
+                    else:
+                        self.logger.debug(f"[{search_record.name}]       ❌ No match: {name_part} - {match_result.reasoning}")
                 
                 except Exception as e:
                     # Skip rows that can't be processed
-                    print(f"      ⚠️ Error processing row {i+1}: {e}")
+                    self.logger.debug(f"[{search_record.name}]       ⚠️ Error processing row {i+1}: {e}")
                     continue
             
-            # Categorize results
-            exact_matches = len([r for r in detailed_results if 'EXACT' in r['match_type']])
-            partial_matches = len([r for r in detailed_results if 'PARTIAL' in r['match_type']])
+            # Every row is counted; only the stored match details are capped, exact matches first
+            if self.max_matches and len(detailed_results) > self.max_matches:
+                self.logger.debug(f"[{search_record.name}]    ⏹️ Keeping {self.max_matches} of {len(detailed_results)} match details")
+                detailed_results.sort(key=lambda detail: 'EXACT' not in detail['match_type'])
+                del detailed_results[self.max_matches:]
             
             # Determine overall status
             if exact_matches > 0:
@@ -312,11 +358,11 @@ class ProductionCLI:
                 'match_category': category,
                 'match_reasoning': reasoning,
                 'detailed_results': detailed_results,
-                'total_results': len(result_rows)
+                'total_results': row_count
             }
             
         except Exception as e:
-            print(f"⚠️ Error extracting results: {str(e)}")
+            print(f"⚠️ {search_record.name}: error extracting results: {str(e)}")
             return {
                 'name': search_record.name,
                 'status': 'Error',
@@ -329,8 +375,66 @@ class ProductionCLI:
                 'detailed_results': []
             }
 
+def _write_storage_state(state: dict):
+    """Save browser storage state via a temporary file, so concurrent searches never read a partial file"""
+    tmp_path = STORAGE_STATE_PATH.with_name(STORAGE_STATE_PATH.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, STORAGE_STATE_PATH)
+
+def export_results_json(results: list, filename: str):
+    """Export results as JSON"""
+    export_data = {
+        'timestamp': datetime.now().isoformat(),
+        'total_results': len(results),
+        'tool_version': 'Production ReadySearch CLI',
+        'results': results
+    }
+    with open(f"{filename}.json", 'w', encoding='utf-8') as f:
+        json.dump(export_data, f, indent=2, ensure_ascii=False)
+
 async def main():
     """Main CLI function"""
+    parser = argparse.ArgumentParser(description='ReadySearch Production CLI')
+    parser.add_argument(
+        'names',
+        nargs='*',
+        help='Names separated by semicolons, with optional ",birth_year" (prompted for if omitted)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Searches to run at once on the shared browser (default: {DEFAULT_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--max-matches',
+        type=int,
+        default=DEFAULT_MAX_MATCHES,
+        help=f'Keep details for at most this many matches per search, 0 for no limit (default: {DEFAULT_MAX_MATCHES})'
+    )
+    parser.add_argument(
+        '--per-search-timeout',
+        type=float,
+        default=DEFAULT_SEARCH_TIMEOUT,
+        help=f'Give up on a search after this many seconds, 0 for no limit (default: {DEFAULT_SEARCH_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--single-process',
+        action='store_true',
+        help='Run Chromium as a single process to save memory (breaks some sites)'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log every result row as it is parsed and matched'
+    )
+    parser.add_argument(
+        '--cdp-endpoint',
+        help='Connect to an already running Chromium over CDP (e.g. http://localhost:9222 for one started '
+             'with --remote-debugging-port=9222) instead of launching a new browser'
+    )
+    args = parser.parse_args()
     
     print("🎯 PRODUCTION READYSEARCH CLI")
     print("📝 Enter names separated by semicolons")
@@ -338,100 +442,143 @@ async def main():
     print("⚡ Optimized for 30-second maximum per search")
     print("")
     
-    # Get input
-    if len(sys.argv) > 1:
-        names_input = ' '.join(sys.argv[1:])
-    else:
-        names_input = input("🔤 Enter names (semicolon-separated): ").strip()
-    
-    if not names_input:
-        print("❌ No names provided. Exiting.")
-        return
-    
-    # Parse names
-    search_records = []
-    names = names_input.split(';')
+    # Create CLI instance and start the shared browser while names are read and parsed
+    cli = ProductionCLI(max_matches=args.max_matches, verbose=args.verbose,
+                        per_search_timeout=args.per_search_timeout)
+    browser_task = asyncio.create_task(cli.start_browser(args.cdp_endpoint, args.single_process))
+    playwright = browser = None
     
-    for name_entry in names:
-        name_entry = name_entry.strip()
-        if ',' in name_entry:
-            parts = name_entry.split(',', 1)
-            name = parts[0].strip()
-            try:
-                birth_year = int(parts[1].strip())
-                search_records.append(SearchRecord(name=name, birth_year=birth_year))
-            except ValueError:
-                search_records.append(SearchRecord(name=name_entry))
+    try:
+        # Get input (off the event loop, so the browser launch keeps going meanwhile)
+        if args.names:
+            names_input = ' '.join(args.names)
         else:
-            search_records.append(SearchRecord(name=name_entry))
-    
-    print(f"📊 Parsed {len(search_records)} names")
-    
-    # Create CLI instance
-    cli = ProductionCLI()
-    
-    # Process each name
-    all_results = []
-    total_start = time.time()
-    
-    for i, search_record in enumerate(search_records):
-        print(f"\n{'='*60}")
-        print(f"🎯 PROCESSING {i+1}/{len(search_records)}: {search_record.name}")
-        print('='*60)
+            names_input = (await asyncio.to_thread(input, "🔤 Enter names (semicolon-separated): ")).strip()
         
-        result = await cli.search_person(search_record)
-        all_results.append(result)
+        if not names_input:
+            print("❌ No names provided. Exiting.")
+            return
         
-        # Performance check
-        if result['search_duration'] <= 30:
-            print(f"✅ PERFORMANCE: {result['search_duration']:.2f}s ≤ 30s target")
-        else:
-            print(f"⚠️ PERFORMANCE: {result['search_duration']:.2f}s > 30s target")
+        # Parse names
+        search_records = [
+            SearchRecord(name=name, birth_year=birth_year) for name, birth_year in parse_name_entries(names_input)
+        ]
         
-        print(f"📊 Status: {result['status']} ({result['match_category']})")
-        if result['detailed_results']:
-            print(f"📋 Matches found:")
-            for j, match in enumerate(result['detailed_results'][:5]):  # Show first 5
-                print(f"   {j+1}. {match['matched_name']} - {match['match_type']}")
+        if not search_records:
+            print("❌ No valid names found in input. Exiting.")
+            return
+        
+        print(f"📊 Parsed {len(search_records)} names")
+        
+        # One browser for the whole run; searches only pay for a new context
+        try:
+            playwright, browser = await browser_task
+        except Exception as e:
+            print(f"❌ Could not start the browser: {e}")
+            return 1
+        
+        # Process names concurrently on one browser
+        print(f"⚡ Running up to {max(1, args.concurrency)} searches at once")
+        total_start = time.time()
+        semaphore = asyncio.Semaphore(max(1, args.concurrency))
+        
+        async def run_one(i: int, search_record: SearchRecord) -> dict:
+            async with semaphore:
+                result = await cli.search_person(search_record, browser)
+            
+            # Build the record's summary first so concurrent searches don't interleave it
+            lines = [
+                f"\n{'='*60}",
+                f"🎯 COMPLETED {i+1}/{len(search_records)}: {search_record.name}",
+                '='*60
+            ]
+            
+            # Performance check
+            if result['search_duration'] <= 30:
+                lines.append(f"✅ PERFORMANCE: {result['search_duration']:.2f}s ≤ 30s target")
+            else:
+                lines.append(f"⚠️ PERFORMANCE: {result['search_duration']:.2f}s > 30s target")
+            
+            lines.append(f"📊 Status: {result['status']} ({result['match_category']})")
+            if result['detailed_results']:
+                lines.append(f"📋 Matches found:")
+                for j, match in enumerate(result['detailed_results'][:5]):  # Show first 5
+                    lines.append(f"   {j+1}. {match['matched_name']} - {match['match_type']}")
+            
+            print('\n'.join(lines))
+            return result
+        
+        all_results = await asyncio.gather(*(run_one(i, r) for i, r in enumerate(search_records)))
+        
+        # Write the results file off the event loop while the browser shuts down
+        filename = f"production_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        save_task = asyncio.create_task(asyncio.to_thread(export_results_json, all_results, filename))
     
-    # Generate comprehensive report
-    total_duration = time.time() - total_start
+    finally:
+        if browser is None:
+            # Exiting before the first search: let the launch finish so it can be shut down
+            try:
+                playwright, browser = await browser_task
+            except Exception:
+                pass
+        if browser:
+            await browser.close()
+        if playwright:
+            await playwright.stop()
     
-    print(f"\n{'='*60}")
-    print("🎯 COMPREHENSIVE REPORT")
-    print('='*60)
+    # A failed save is reported with the results rather than hiding them
+    try:
+        await save_task
+        save_error = None
+    except Exception as e:
+        save_error = e
     
-    print(f"📊 PERFORMANCE SUMMARY:")
-    print(f"   Total Time: {total_duration:.2f}s")
-    print(f"   Average per Search: {total_duration/len(all_results):.2f}s")
+    # Generate comprehensive report, written to stdout in one go
+    total_duration = time.time() - total_start
     
     performance_met = all(r['search_duration'] <= 30 for r in all_results)
-    print(f"   30s Target: {'✅ MET' if performance_met else '❌ EXCEEDED'}")
-    
     matches = [r for r in all_results if r['matches_found'] > 0]
     no_matches = [r for r in all_results if r['matches_found'] == 0 and r['status'] != 'Error']
     errors = [r for r in all_results if r['status'] == 'Error']
     
-    print(f"\n📋 RESULTS BREAKDOWN:")
-    print(f"   ✅ Found Matches: {len(matches)}")
-    print(f"   ⭕ No Matches: {len(no_matches)}")
-    print(f"   ❌ Errors: {len(errors)}")
-    print(f"   🎯 Success Rate: {((len(matches) + len(no_matches))/len(all_results)*100):.1f}%")
+    lines = [
+        f"\n{'='*60}",
+        "🎯 COMPREHENSIVE REPORT",
+        '='*60,
+        f"📊 PERFORMANCE SUMMARY:",
+        f"   Total Time: {total_duration:.2f}s",
+        f"   Average per Search: {(total_duration/len(all_results) if all_results else 0):.2f}s",
+        f"   30s Target: {'✅ MET' if performance_met else '❌ EXCEEDED'}",
+        f"\n📋 RESULTS BREAKDOWN:",
+        f"   ✅ Found Matches: {len(matches)}",
+        f"   ⭕ No Matches: {len(no_matches)}",
+        f"   ❌ Errors: {len(errors)}",
+        f"   🎯 Success Rate: {((len(matches) + len(no_matches))/len(all_results)*100 if all_results else 0):.1f}%",
+        f"\n📄 DETAILED BREAKDOWN:"
+    ]
     
-    print(f"\n📄 DETAILED BREAKDOWN:")
     for i, result in enumerate(all_results):
         status_emoji = "✅" if result['matches_found'] > 0 else "⭕" if result['status'] != 'Error' else "❌"
         birth_info = f" (born {result.get('birth_year', 'N/A')})" if 'birth_year' in result else ""
         
-        print(f"   {i+1}. {status_emoji} {result['name']}{birth_info}")
-        print(f"      Status: {result['status']} | Duration: {result['search_duration']:.2f}s | Matches: {result['matches_found']}")
+        lines.append(f"   {i+1}. {status_emoji} {result['name']}{birth_info}")
+        lines.append(f"      Status: {result['status']} | Duration: {result['search_duration']:.2f}s | Matches: {result['matches_found']}")
         
         if result['detailed_results']:
             for j, match in enumerate(result['detailed_results'][:3]):
-                print(f"         • {match['matched_name']} ({match['match_type']})")
+                lines.append(f"         • {match['matched_name']} ({match['match_type']})")
+    
+    if save_error:
+        lines.append(f"\n❌ Could not export results to {filename}.json: {save_error}")
+    else:
+        lines.append(f"\n💾 Results exported to {filename}.json")
+    lines.append('='*60)
+    lines.append("🎉 AUTOMATION COMPLETED!")
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
     
-    print('='*60)
-    print("🎉 AUTOMATION COMPLETED!")
+    if save_error:
+        return 1
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
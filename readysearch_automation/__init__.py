@@ -1,18 +1,13 @@
 """ReadySearch.com.au automation package."""
 
-from .input_loader import InputLoader
-from .browser_controller import BrowserController
-from .popup_handler import PopupHandler
-from .result_parser import ResultParser, NameMatcher
-from .enhanced_result_parser import EnhancedResultParser, EnhancedNameMatcher, SearchStatistics
-from .reporter import Reporter
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "ReadySearch Automation"
 
 __all__ = [
     'InputLoader',
-    'BrowserController', 
+    'BrowserController',
     'PopupHandler',
     'ResultParser',
     'NameMatcher',
@@ -20,4 +15,28 @@ __all__ = [
     'EnhancedNameMatcher',
     'SearchStatistics',
     'Reporter'
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule it lives in. Submodules are imported on first access,
+# so e.g. importing InputLoader does not pull in Playwright.
+_LAZY_EXPORTS = {
+    'InputLoader': 'input_loader',
+    'BrowserController': 'browser_controller',
+    'PopupHandler': 'popup_handler',
+    'ResultParser': 'result_parser',
+    'NameMatcher': 'result_parser',
+    'EnhancedResultParser': 'enhanced_result_parser',
+    'EnhancedNameMatcher': 'enhanced_result_parser',
+    'SearchStatistics': 'enhanced_result_parser',
+    'Reporter': 'reporter'
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ Handles sophisticated matching with detailed reasoning and explanations.
 
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -288,6 +289,10 @@ class AdvancedNameMatcher:
             }
         )
 
+    def normalize_name(self, name: str) -> str:
+        """Normalize a name the same way the matching methods do."""
+        return self._normalize_name(name)
+
     def _normalize_name(self, name: str) -> str:
         """Normalize name for comparison."""
         if not name:
@@ -329,7 +334,8 @@ class AdvancedNameMatcher:
         
         return None
 
-    def match_names_strict(self, search_name: str, result_name: str, exact_first_name: bool = False) -> MatchResult:
+    def match_names_strict(self, search_name: str, result_name: str, exact_first_name: bool = False,
+                           normalized_search_name: Optional[str] = None) -> MatchResult:
         """
         Strict name matching with user-specified criteria:
         
@@ -349,6 +355,8 @@ class AdvancedNameMatcher:
             search_name: The name being searched for
             result_name: The name found in results
             exact_first_name: If True, requires exact first name match (stricter)
+            normalized_search_name: Optional result of normalize_name(search_name), so
+                batch callers can normalize each search name once instead of per row
             
         Returns:
             MatchResult with strict matching rules applied
@@ -363,7 +371,10 @@ class AdvancedNameMatcher:
             )
         
         # Normalize names for comparison
-        norm_search = self._normalize_name(search_name)
+        if normalized_search_name is None:
+            norm_search = self._normalize_name(search_name)
+        else:
+            norm_search = normalized_search_name
         norm_result = self._normalize_name(result_name)
         
         search_words = norm_search.split()
@@ -731,4 +742,39 @@ class AdvancedNameMatcher:
                 "explanation": f"{len(exact_word_matches)}/{len(search_words)} words match exactly: {', '.join(exact_word_matches)}"
             }
         
-        return None
\ No newline at end of file
+        return None
+
+# Upper bound on memoized match results shared by every caller in the process
+MATCH_CACHE_SIZE = 16384
+
+@lru_cache(maxsize=1)
+def _shared_matcher() -> AdvancedNameMatcher:
+    """Matcher instance behind the cached module-level helpers."""
+    return AdvancedNameMatcher()
+
+@lru_cache(maxsize=1024)
+def _normalized_search_name(search_name: str) -> str:
+    """Normalize each search name once, however many result rows it is compared with."""
+    return _shared_matcher().normalize_name(search_name)
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def match_names_cached(search_name: str, result_name: str) -> MatchResult:
+    """
+    Memoized AdvancedNameMatcher.match_names.
+    
+    Result names repeat across rows, searches and sessions, so repeated pairs skip the
+    matching pipeline. The returned MatchResult is shared between callers; treat it as read-only.
+    """
+    return _shared_matcher().match_names(search_name, result_name)
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def match_names_strict_cached(search_name: str, result_name: str, exact_first_name: bool = False) -> MatchResult:
+    """
+    Memoized AdvancedNameMatcher.match_names_strict.
+    
+    The returned MatchResult is shared between callers; treat it as read-only.
+    """
+    return _shared_matcher().match_names_strict(
+        search_name, result_name, exact_first_name,
+        normalized_search_name=_normalized_search_name(search_name)
+    )
@@ -0,0 +1,53 @@
+"""Parsing of typed name lists and ReadySearch result row text."""
+
+import re
+from typing import List, Optional, Tuple
+
+# "Name[,Year];..." entries in one sweep; entries without a numeric year keep their raw text as the name
+_ENTRY_RE = re.compile(r'\s*(?:([^,;]+?)\s*,\s*(\d+)|([^;]*?))\s*(?:;|$)')
+
+# Result row cells are separated by "|", tabs or line breaks depending on how the text was read
+_CELL_SPLIT_RE = re.compile(r'[|\t\n]')
+# A whole cell holding a name: letters plus spaces, apostrophes, hyphens and dots
+_NAME_CELL_RE = re.compile(r"[^\W\d_](?:[^\W\d_]|[ '.\-])+")
+# The date of birth label and its value, which may be blank: a "12 Jun 1975" style date,
+# otherwise the first token up to whitespace or a "|" cell separator; a tab starts the next cell
+_DOB_RE = re.compile(r'Date of Birth: *(\d{1,2} [^\W\d_]{3,9} \d{4}|[^\s|]+)?')
+
+
+def parse_name_entries(names_input: str) -> List[Tuple[str, Optional[int]]]:
+    """
+    Split "Name[,Year];..." input into (name, birth year) pairs.
+
+    Empty entries are skipped; an entry whose year is not numeric keeps its raw text as the name.
+    """
+    return [
+        (name, int(birth_year)) if name else (raw_entry, None)
+        for name, birth_year, raw_entry in _ENTRY_RE.findall(names_input)
+        if name or raw_entry
+    ]
+
+
+def parse_result_row(row_text: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract (name, date of birth) from the text of one results table row.
+
+    The name is the first cell before the "Date of Birth:" label made up only of name
+    characters and longer than two characters, so "SMITH JOHN | 42 Street | Date of Birth: ..."
+    gives "SMITH JOHN". Text ahead of the label in its own cell is the last candidate, for rows
+    such as "SMITH JOHN Date of Birth: ...". A blank date of birth is returned as "".
+
+    Returns:
+        (name, date_of_birth), or None if the row is not a result row
+    """
+    dob_match = _DOB_RE.search(row_text)
+    if not dob_match:
+        return None
+
+    # The last piece is the date's own cell up to its label
+    for cell in _CELL_SPLIT_RE.split(row_text[:dob_match.start()]):
+        cell = cell.strip()
+        if len(cell) > 2 and _NAME_CELL_RE.fullmatch(cell):
+            return cell, dob_match.group(1) or ''
+
+    return None
@@ -0,0 +1,46 @@
+"""Tests for name normalization and the cached matching helpers."""
+
+import pytest
+
+from readysearch_automation.advanced_name_matcher import (
+    AdvancedNameMatcher, MatchType, match_names_cached, match_names_strict_cached
+)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return AdvancedNameMatcher()
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("John Smith", "john smith"),
+    ("  JOHN   SMITH  ", "john smith"),
+    ("Dr. John Smith Jr", "john smith"),
+    ("O'Brien John", "obrien john"),
+    ("", ""),
+])
+def test_normalize_name(matcher, name, expected):
+    assert matcher.normalize_name(name) == expected
+
+
+@pytest.mark.parametrize("result_name", ["JOHN SMITH", "JOHN MICHAEL SMITH", "JON SMITH", "JOHN SMYTH"])
+def test_prenormalized_search_name_gives_same_result(matcher, result_name):
+    plain = matcher.match_names_strict("John Smith", result_name)
+    prenormalized = matcher.match_names_strict(
+        "John Smith", result_name, normalized_search_name=matcher.normalize_name("John Smith")
+    )
+    assert (prenormalized.match_type, prenormalized.confidence) == (plain.match_type, plain.confidence)
+
+
+def test_match_names_strict_cached(matcher):
+    first = match_names_strict_cached("Andro Cutuk", "ANDRO CUTUK", False)
+    assert first.match_type == MatchType.EXACT
+    assert match_names_strict_cached("Andro Cutuk", "ANDRO CUTUK", False) is first
+    assert match_names_strict_cached("Andro Cutuk", "ANDREW CUTUK", False).match_type == \
+        matcher.match_names_strict("Andro Cutuk", "ANDREW CUTUK").match_type
+
+
+def test_match_names_cached(matcher):
+    first = match_names_cached("John Smith", "JOHN MICHAEL SMITH")
+    assert match_names_cached("John Smith", "JOHN MICHAEL SMITH") is first
+    assert first.match_type == matcher.match_names("John Smith", "JOHN MICHAEL SMITH").match_type
@@ -0,0 +1,14 @@
+"""Tests for configuration helpers."""
+
+import pytest
+
+from config import env_positive_int
+
+
+@pytest.mark.parametrize("raw_value, expected", [(None, 3), ("", 3), ("5", 5), ("abc", 3), ("0", 1), ("-2", 1)])
+def test_env_positive_int(monkeypatch, raw_value, expected):
+    if raw_value is None:
+        monkeypatch.delenv("READYSEARCH_POOL_SIZE", raising=False)
+    else:
+        monkeypatch.setenv("READYSEARCH_POOL_SIZE", raw_value)
+    assert env_positive_int("READYSEARCH_POOL_SIZE", 3) == expected
@@ -0,0 +1,139 @@
+"""Tests for the pure helpers of the optimized batch CLI."""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("playwright.async_api")
+pytest.importorskip("pandas")
+
+import optimized_batch_cli
+from optimized_batch_cli import (
+    AioSearchClient, OptimizedBatchSearcher, OptimizedSearchResult, SearchRecord, export_results_json,
+    parse_names_input
+)
+
+requires_http_client = pytest.mark.skipif(
+    not optimized_batch_cli.HTTP_CLIENT_AVAILABLE, reason="aiohttp/selectolax not installed"
+)
+
+SEARCH_FORM_HTML = """
+<form action="/products/search" method="post">
+  <input type="hidden" name="token" value="abc123">
+  <input type="text" name="search">
+  <input type="checkbox" name="exact" value="1" checked>
+  <input type="checkbox" name="archived" value="1">
+  <input type="radio" name="scope" value="all">
+  <input type="radio" name="scope" value="au" checked>
+  <select name="yobs"><option value="1900">1900</option><option value="1901">1901</option></select>
+  <select name="yobe"><option value="1900">1900</option><option value="2025" selected>2025</option></select>
+  <input type="submit" class="sch_but" name="go" value="Search">
+</form>
+"""
+
+RESULTS_HTML = """
+<table>
+  <tr><th>Name</th><th>Date of Birth</th><th>Location</th></tr>
+  <tr><td><b>ANDRO</b> CUTUK</td><td>Date of Birth: <span>12/06/1975</span></td><td>SYDNEY NSW</td></tr>
+  <tr><td>O'BRIEN <i>JOHN</i></td><td>Date of Birth:</td><td>PERTH WA</td></tr>
+  <tr><td colspan="3">Showing 2 results</td></tr>
+</table>
+"""
+
+
+def make_result(name="John Smith", **overrides) -> OptimizedSearchResult:
+    fields = dict(
+        name=name, status='Match', search_duration=1.5, matches_found=1, exact_matches=1,
+        partial_matches=0, match_category='EXACT MATCH', match_reasoning='Found 1 exact matches',
+        detailed_results=[{'matched_name': name.upper(), 'date_of_birth': '01/01/1980'}],
+        timestamp='2025-01-01T00:00:00'
+    )
+    fields.update(overrides)
+    return OptimizedSearchResult(**fields)
+
+
+def test_parse_names_input():
+    records = parse_names_input("John Smith;Jane Doe,1990;;")
+    assert [(r.name, r.birth_year) for r in records] == [("John Smith", None), ("Jane Doe", 1990)]
+
+
+@requires_http_client
+def test_form_defaults():
+    form = optimized_batch_cli.HTMLParser(SEARCH_FORM_HTML).css_first('form')
+    assert AioSearchClient._form_defaults(form) == {
+        'token': 'abc123', 'search': '', 'exact': '1', 'scope': 'au', 'yobs': '1900', 'yobe': '2025', 'go': 'Search'
+    }
+
+
+@requires_http_client
+def test_extract_row_texts_keeps_each_cell_whole():
+    row_texts = AioSearchClient.extract_row_texts(RESULTS_HTML)
+    assert row_texts == [
+        "ANDRO CUTUK\tDate of Birth: 12/06/1975\tSYDNEY NSW",
+        "O'BRIEN JOHN\tDate of Birth:\tPERTH WA",
+    ]
+
+    searcher = OptimizedBatchSearcher(render_js=True)
+    results = searcher.parse_result_rows(row_texts, SearchRecord(name="Andro Cutuk"))
+    assert [(r['matched_name'], r['date_of_birth']) for r in results['detailed_results']] == [
+        ("ANDRO CUTUK", "12/06/1975")
+    ]
+
+
+def test_parse_result_rows_categorizes_matches():
+    searcher = OptimizedBatchSearcher(render_js=True)
+    rows = [
+        "ANDRO CUTUK | Date of Birth: 12/06/1975\tSYDNEY NSW |",
+        "ANDRO MICHAEL CUTUK | Date of Birth: 03/03/1976 |",
+        "JOHN SMITH | Date of Birth: 01/01/1980 |",
+    ]
+    results = searcher.parse_result_rows(rows, SearchRecord(name="Andro Cutuk"))
+
+    assert results['status'] == 'Match'
+    assert results['exact_matches'] + results['partial_matches'] == results['matches_found'] == 2
+    assert [r['matched_name'] for r in results['detailed_results']] == ["ANDRO CUTUK", "ANDRO MICHAEL CUTUK"]
+    assert results['detailed_results'][0]['date_of_birth'] == "12/06/1975"
+
+
+def test_parse_result_rows_without_results():
+    searcher = OptimizedBatchSearcher(render_js=True)
+    results = searcher.parse_result_rows(["Name | Date of Birth | Location"], SearchRecord(name="Zed Q"))
+    assert results['status'] == 'No Match'
+    assert results['matches_found'] == 0
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_results_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and not optimized_batch_cli.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(optimized_batch_cli, 'ORJSON_AVAILABLE', use_orjson)
+    filename = str(tmp_path / "results")
+
+    export_results_json([make_result(), make_result("Jane Doe", status='Error', matches_found=0)], filename)
+
+    text = (tmp_path / "results.json").read_text(encoding='utf-8')
+    data = json.loads(text)
+    assert [r['name'] for r in data['results']] == ["John Smith", "Jane Doe"]
+    assert data['performance_summary']['successful_searches'] == 1
+    assert data['performance_summary']['total_duration'] == 3.0
+    # One serializer for the whole document: every nested line is indented by a multiple of 2
+    assert all((len(line) - len(line.lstrip(' '))) % 2 == 0 for line in text.splitlines())
+    assert text.startswith('{\n  "export_info"')
+    assert os.listdir(tmp_path) == ["results.json"]
+
+
+def test_export_results_json_keeps_previous_file_on_failure(tmp_path, monkeypatch):
+    target = tmp_path / "results.json"
+    target.write_text('{"previous": true}', encoding='utf-8')
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+    monkeypatch.setattr(optimized_batch_cli.os, 'fsync', failing_fsync)
+
+    with pytest.raises(OSError):
+        export_results_json([make_result()], str(tmp_path / "results"))
+
+    assert json.loads(target.read_text(encoding='utf-8')) == {"previous": True}
+    assert os.listdir(tmp_path) == ["results.json"]
+
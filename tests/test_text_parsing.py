@@ -0,0 +1,57 @@
+"""Tests for name input and result row parsing."""
+
+import pytest
+
+from readysearch_automation.text_parsing import parse_name_entries, parse_result_row
+
+
+@pytest.mark.parametrize("row_text, expected", [
+    ("ANDRO CUTUK | Date of Birth: 12/06/1975\tSYDNEY NSW |", ("ANDRO CUTUK", "12/06/1975")),
+    ("ANDRO MICHAEL CUTUK\nDate of Birth: 03/03/1976\tPERTH WA", ("ANDRO MICHAEL CUTUK", "03/03/1976")),
+    ("ANDRO CUTUK\tDate of Birth: 12/06/1975\tSYDNEY NSW", ("ANDRO CUTUK", "12/06/1975")),
+    ("O'BRIEN JOHN | Date of Birth: 01/02/1980 |", ("O'BRIEN JOHN", "01/02/1980")),
+    ("MARY-JANE ST. CLAIR | Date of Birth: 01/02/1980", ("MARY-JANE ST. CLAIR", "01/02/1980")),
+    ("SMITH JOHN | 42 Street | Date of Birth: 01/01/1980 |", ("SMITH JOHN", "01/01/1980")),
+    ("1 | SMITH JOHN | Date of Birth: 01/01/1980", ("SMITH JOHN", "01/01/1980")),
+    ("SMITH JOHN | Date of Birth: | SYDNEY NSW", ("SMITH JOHN", "")),
+    ("ANDRO CUTUK Date of Birth: 01/01/1980", ("ANDRO CUTUK", "01/01/1980")),
+    ("1 | ANDRO CUTUK Date of Birth: 01/01/1980 | SYDNEY NSW", ("ANDRO CUTUK", "01/01/1980")),
+])
+def test_parse_result_row(row_text, expected):
+    assert parse_result_row(row_text) == expected
+
+
+@pytest.mark.parametrize("date_text, expected", [
+    ("12/06/1975", "12/06/1975"),
+    ("1975-06-12", "1975-06-12"),
+    ("12-06-1975", "12-06-1975"),
+    ("12 Jun 1975", "12 Jun 1975"),
+    ("1975", "1975"),
+    ("", ""),
+])
+def test_parse_result_row_date_formats(date_text, expected):
+    row_text = f"ANDRO CUTUK | Date of Birth: {date_text}\tSYDNEY NSW |"
+    assert parse_result_row(row_text) == ("ANDRO CUTUK", expected)
+
+
+@pytest.mark.parametrize("row_text", [
+    "Name | Date of Birth | Location",
+    "",
+    "JO | Date of Birth: 01/01/1980",
+    "12345 | Date of Birth: 01/01/1980",
+])
+def test_parse_result_row_rejects_non_results(row_text):
+    assert parse_result_row(row_text) is None
+
+
+@pytest.mark.parametrize("names_input, expected", [
+    ("John Smith;Jane Doe,1990;Bob Jones", [("John Smith", None), ("Jane Doe", 1990), ("Bob Jones", None)]),
+    (" Jane Doe , 1990 ; ", [("Jane Doe", 1990)]),
+    ("a b , 19x", [("a b , 19x", None)]),
+    ("O'Brien John", [("O'Brien John", None)]),
+    (";", []),
+    ("  ;  ; ", []),
+    ("", []),
+])
+def test_parse_name_entries(names_input, expected):
+    assert parse_name_entries(names_input) == expected